@@ -1,15 +1,217 @@
 import streamlit as st
 import os
+import json
+import logging
+import queue
+import threading
+import time
 import webbrowser
 import shutil
+import tempfile
 from pathlib import Path
 
 # Define the base directory for the link folders. Use a hidden directory.
 BASE_DIR = Path(".multi_link_app_data")
 
 # Ensure the base directory exists
-if not BASE_DIR.exists():
-    BASE_DIR.mkdir(parents=True, exist_ok=True)
+BASE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Name of the per-folder file that stores all links of a folder.
+LINKS_INDEX = "links.json"
+
+# Number of tabs opened per batch. Falls back to 5 if WIQ_CONCURRENT_TABS isn't a number.
+try:
+    MAX_CONCURRENT_TABS = max(1, int(os.getenv("WIQ_CONCURRENT_TABS", "5")))
+except ValueError:
+    MAX_CONCURRENT_TABS = 5
+# Minimum pause in seconds between batches. The pause grows to match a batch's
+# own duration when the browser is slow to accept new tabs.
+TAB_BATCH_DELAY = 0.3
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource
+def _index_lock():
+    """
+    Returns the lock that serializes load-modify-write of link indexes.
+    Streamlit runs each session's script on its own thread, so concurrent adds
+    would otherwise drop links. Streamlit re-executes this module on every
+    rerun, so the lock is held in st.cache_resource to be shared by all
+    sessions instead of being a module global.
+
+    Returns:
+        threading.RLock: The shared index lock.
+    """
+    return threading.RLock()
+
+
+@st.cache_resource
+def _new_file_mode():
+    """
+    Returns the mode a newly created file gets under the process umask, i.e.
+    what open() would give it. The umask can only be read by swapping it, so
+    this is done once per process rather than on every write.
+
+    Returns:
+        int: The permission bits for new files.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _parse_index(index_path):
+    """
+    Reads and parses a link index file.
+
+    Args:
+        index_path (str): The path of the index file.
+
+    Returns:
+        dict: A dictionary of link names and URLs.
+    """
+    return json.loads(Path(index_path).read_text())
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _read_index(index_path, ino, mtime_ns, size):
+    """
+    Parses a link index file for display. Cached on the file's inode, mtime
+    and size so that reruns which don't modify the folder skip the read
+    entirely. Every write replaces the file with a new one, so the inode
+    catches most changes that a coarse-timestamp filesystem hides from mtime.
+
+    Args:
+        index_path (str): The path of the index file.
+        ino (int): The inode number of the file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+
+    Returns:
+        dict: A dictionary of link names and URLs.
+    """
+    return _parse_index(index_path)
+
+
+def _migrate_legacy_links(folder_path, for_update=False):
+    """
+    Collects links stored in the old one-text-file-per-link layout and
+    writes them to the folder's index. Files that can't be read are reported
+    and skipped, and the index is then not written so the next read retries
+    them. If the index can't be written, the links are still returned.
+
+    Args:
+        folder_path (Path): The path of the folder.
+        for_update (bool): Raise on an unreadable file instead of skipping it,
+            so a caller about to rewrite the index doesn't drop that link.
+
+    Returns:
+        dict: A dictionary of link names and URLs.
+    """
+    links = {}
+    complete = True
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if entry.name.endswith(".txt") and entry.is_file(follow_symlinks=False):
+                try:
+                    with open(entry.path, "r") as f:
+                        links[entry.name[:-4]] = f.read().strip()
+                except Exception as e:
+                    if for_update:
+                        raise
+                    complete = False
+                    st.error(f"Error reading link from {entry.path}: {e}")
+    if links and complete:
+        try:
+            _write_index(folder_path, links)
+        except OSError as e:
+            logger.warning("Could not write link index for %s: %s", folder_path, e)
+    return links
+
+
+def _load_index(folder_path, for_update=False):
+    """
+    Loads the links of a folder from its index file.
+
+    Args:
+        folder_path (Path): The path of the folder.
+        for_update (bool): Whether the caller is going to rewrite the index. The
+            index is then read from disk, bypassing the cache; hold _index_lock().
+
+    Returns:
+        dict: A dictionary of link names and URLs (empty if the folder has no links).
+    """
+    index_path = folder_path / LINKS_INDEX
+    try:
+        stat = os.stat(index_path)
+    except FileNotFoundError:
+        with _index_lock():
+            # Re-check under the lock, another session may have written the index meanwhile.
+            try:
+                stat = os.stat(index_path)
+            except FileNotFoundError:
+                return _migrate_legacy_links(folder_path, for_update)
+    if for_update:
+        return _parse_index(str(index_path))
+    # st.cache_data hands out a copy, so callers can't mutate the cached dictionary.
+    return _read_index(str(index_path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _write_index(folder_path, links):
+    """
+    Writes the links of a folder to its index file. The data goes to a unique
+    temp file that is then renamed over the index, so readers never see a
+    partially written file. Callers that modify the index must hold _index_lock().
+
+    Args:
+        folder_path (Path): The path of the folder.
+        links (dict): A dictionary of link names and URLs.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=folder_path, prefix=f"{LINKS_INDEX}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            # mkstemp creates the file as 0600; give the index the usual umask-based mode.
+            os.fchmod(f.fileno(), _new_file_mode())
+            json.dump(links, f, indent=2)
+        os.replace(tmp_path, folder_path / LINKS_INDEX)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _iter_dirnames(path):
+    """
+    Yields the names of the subdirectories of a directory.
+
+    Args:
+        path (Path): The directory to list.
+
+    Yields:
+        str: The name of each subdirectory.
+    """
+    with os.scandir(path) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                yield e.name
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _list_folders(mtime_ns, nlink):
+    """
+    Lists the folder names in the base directory. Cached on the base
+    directory's mtime and link count, which change whenever a folder is
+    created or deleted. The link count catches changes within one tick on
+    filesystems with coarse timestamps.
+
+    Args:
+        mtime_ns (int): The modification time of BASE_DIR in nanoseconds.
+        nlink (int): The number of hard links to BASE_DIR.
+
+    Returns:
+        list: The names of the existing folders.
+    """
+    return list(_iter_dirnames(BASE_DIR))
 
 
 def create_folder(folder_name):
@@ -20,17 +222,17 @@ def create_folder(folder_name):
         folder_name (str): The name of the folder to create.
     """
     folder_path = BASE_DIR / folder_name
-    if not folder_path.exists():
-        folder_path.mkdir(parents=True, exist_ok=True)
+    try:
+        folder_path.mkdir(parents=True)
         st.success(f"Folder '{folder_name}' created successfully!")
-    else:
+    except FileExistsError:
         st.warning(f"Folder '{folder_name}' already exists.")
     return folder_path  # Return the path to the created folder
 
 
 def add_link_to_folder(folder_name, link_name, link_url):
     """
-    Adds a link to a specified folder. The link is stored in a text file.
+    Adds a link to a specified folder. The link is stored in the folder's index file.
 
     Args:
         folder_name (str): The name of the folder.
@@ -38,20 +240,25 @@ def add_link_to_folder(folder_name, link_name, link_url):
         link_url (str): The URL of the link.
     """
     folder_path = BASE_DIR / folder_name
-    if not folder_path.exists():
-        st.error(f"Folder '{folder_name}' does not exist.")
-        return
-
-    link_file_path = folder_path / f"{link_name.strip()}.txt"
-    if not link_file_path.exists():
+    with _index_lock():
         try:
-            with open(link_file_path, "w") as f:
-                f.write(link_url.strip())  # Strip to remove extra spaces
-            st.success(f"Link '{link_name}' added to folder '{folder_name}' successfully!")
+            links = _load_index(folder_path, for_update=True)
+        except FileNotFoundError:
+            st.error(f"Folder '{folder_name}' does not exist.")
+            return
         except Exception as e:
             st.error(f"Error adding link: {e}")
-    else:
-        st.warning(f"Link '{link_name}' already exists in folder '{folder_name}'.")
+            return
+
+        if link_name.strip() not in links:
+            try:
+                links[link_name.strip()] = link_url.strip()  # Strip to remove extra spaces
+                _write_index(folder_path, links)
+                st.success(f"Link '{link_name}' added to folder '{folder_name}' successfully!")
+            except Exception as e:
+                st.error(f"Error adding link: {e}")
+        else:
+            st.warning(f"Link '{link_name}' already exists in folder '{folder_name}'.")
 
 
 def read_links_from_folder(folder_name):
@@ -65,35 +272,84 @@ def read_links_from_folder(folder_name):
         dict: A dictionary of link names and URLs, or None if the folder doesn't exist or is empty.
     """
     folder_path = BASE_DIR / folder_name
-    if not folder_path.exists():
+    try:
+        links = _load_index(folder_path)
+    except FileNotFoundError:
         st.error(f"Folder '{folder_name}' does not exist.")
         return None
-
-    links = {}
-    for file_path in folder_path.glob("*.txt"):
-        try:
-            with open(file_path, "r") as f:
-                link_url = f.read().strip()
-            links[file_path.stem] = link_url
-        except Exception as e:
-            st.error(f"Error reading link from {file_path}: {e}")
+    except Exception as e:
+        st.error(f"Error reading links from folder '{folder_name}': {e}")
+        return None
     return links if links else None
 
 
+def _opener(url_queue):
+    """
+    Opens queued URLs in batches of MAX_CONCURRENT_TABS, pausing between
+    batches so the browser isn't flooded with tabs. The pause is at least
+    TAB_BATCH_DELAY, or as long as the previous batch took to open if that was
+    longer. Runs forever on the single background thread started by
+    _tab_queue(), so failures are logged rather than shown in the app.
+
+    Args:
+        url_queue (queue.Queue): Queue of URL lists submitted by open_links.
+    """
+    pending = []
+    while True:
+        if not pending:
+            pending.extend(url_queue.get())  # Block until there is something to open
+        # Pick up anything else submitted meanwhile so it shares the batch limit.
+        while True:
+            try:
+                pending.extend(url_queue.get_nowait())
+            except queue.Empty:
+                break
+        batch, pending = pending[:MAX_CONCURRENT_TABS], pending[MAX_CONCURRENT_TABS:]
+
+        failed = 0
+        start = time.monotonic()
+        for url in batch:
+            try:
+                # webbrowser.open_new_tab falls back to the next registered browser if one fails.
+                if not webbrowser.open_new_tab(url):
+                    failed += 1
+                    logger.warning("No browser could open link %s", url)
+            except Exception:
+                failed += 1
+                logger.exception("Error opening link %s", url)
+        if failed:
+            logger.warning("Failed to open %d of %d link(s)", failed, len(batch))
+        time.sleep(max(TAB_BATCH_DELAY, time.monotonic() - start))
+
+
+@st.cache_resource
+def _tab_queue():
+    """
+    Returns the queue of URLs waiting to be opened and starts the worker that
+    drains it. Held in st.cache_resource so every click and every session
+    feeds the same worker, which makes MAX_CONCURRENT_TABS and TAB_BATCH_DELAY
+    limits for the whole process rather than per click.
+
+    Returns:
+        queue.Queue: The shared URL queue.
+    """
+    url_queue = queue.Queue()
+    threading.Thread(target=_opener, args=(url_queue,), daemon=True).start()
+    return url_queue
+
+
 def open_links(links):
     """
-    Opens multiple links in the default web browser.
+    Opens multiple links in the default web browser. The tabs are opened by
+    a shared background thread so the app stays responsive.
 
     Args:
         links (dict): A dictionary of link names and URLs.
     """
     if links:
-        for link_name, link_url in links.items():
-            try:
-                webbrowser.open_new_tab(link_url)
-                st.success(f"Opened link: {link_name} - {link_url}")
-            except Exception as e:
-                st.error(f"Error opening link {link_name}: {e}")
+        urls = list(dict.fromkeys(links.values()))  # Don't open the same URL twice
+        _tab_queue().put(urls)
+        st.success(f"Opening {len(urls)} link(s) from: {', '.join(links)}")
     else:
         st.info("No links to open.")
 
@@ -106,14 +362,13 @@ def delete_folder(folder_name):
         folder_name (str): The name of the folder to delete.
     """
     folder_path = BASE_DIR / folder_name
-    if folder_path.exists():
-        try:
-            shutil.rmtree(folder_path)
-            st.success(f"Folder '{folder_name}' and its contents deleted successfully!")
-        except Exception as e:
-            st.error(f"Error deleting folder '{folder_name}': {e}")
-    else:
+    try:
+        shutil.rmtree(folder_path)
+        st.success(f"Folder '{folder_name}' and its contents deleted successfully!")
+    except FileNotFoundError:
         st.warning(f"Folder '{folder_name}' does not exist.")
+    except Exception as e:
+        st.error(f"Error deleting folder '{folder_name}': {e}")
 
 
 def display_app():
@@ -122,44 +377,67 @@ def display_app():
     """
     st.title("Multi-Link Opener")
 
-    # Sidebar for folder management
+    # Sidebar for folder management. Inputs live in forms so typing doesn't trigger a rerun per keystroke.
     st.sidebar.header("Folder Management")
-    new_folder_name = st.sidebar.text_input("New Folder Name:")
-    if st.sidebar.button("Create Folder"):
-        create_folder(new_folder_name)
+    with st.sidebar.form("new_folder", clear_on_submit=True):
+        new_folder_name = st.text_input("New Folder Name:")
+        if st.form_submit_button("Create Folder"):
+            create_folder(new_folder_name)
 
-    folder_to_delete = st.sidebar.text_input("Folder to Delete:")
-    if st.sidebar.button("Delete Folder"):
-        delete_folder(folder_to_delete)
+    with st.sidebar.form("delete_folder", clear_on_submit=True):
+        folder_to_delete = st.text_input("Folder to Delete:")
+        if st.form_submit_button("Delete Folder"):
+            delete_folder(folder_to_delete)
 
     # Sidebar for link management
     st.sidebar.header("Link Management")
-    existing_folders = [d.name for d in BASE_DIR.iterdir() if d.is_dir()]  # Get existing folder names
+    # Get existing folder names. Read the mtime after the create/delete handlers above have run.
+    base_stat = os.stat(BASE_DIR)
+    existing_folders = _list_folders(base_stat.st_mtime_ns, base_stat.st_nlink)
+    # Kept outside the form so clear_on_submit doesn't reset the chosen folder after each add.
     folder_name = st.sidebar.selectbox("Folder Name:", existing_folders) # Use selectbox
-    link_name = st.sidebar.text_input("Link Name:")
-    link_url = st.sidebar.text_input("Link URL:")
-    if st.sidebar.button("Add Link"):
-        add_link_to_folder(folder_name, link_name, link_url)
+    with st.sidebar.form("add_link", clear_on_submit=True):
+        link_name = st.text_input("Link Name:")
+        link_url = st.text_input("Link URL:")
+        if st.form_submit_button("Add Link"):
+            add_link_to_folder(folder_name, link_name, link_url)
 
     # Main area for displaying and opening links
     st.header("Open Links")
     folder_name_to_open = st.selectbox(
         "Select a folder to open links from:",
-        [d.name for d in BASE_DIR.iterdir() if d.is_dir()],
+        existing_folders,
     )
     if folder_name_to_open:
         links_to_open = read_links_from_folder(folder_name_to_open)
         if links_to_open:
             st.write(f"Links in folder '{folder_name_to_open}':")
-            selected_links = []  # List to store selected links
-            for link_name, link_url in links_to_open.items():
-                # Add a checkbox for each link.  Use the link name as the key.
-                checked = st.checkbox(f"{link_name} - [{link_url}]({link_url})", key=link_name)
-                if checked:
-                    selected_links.append((link_name, link_url))  # Add selected links to the list
+            # Show all links in one editable table instead of a checkbox widget per link.
+            import pandas as pd  # Imported lazily; only needed once a folder has links
+
+            links_df = pd.DataFrame(
+                {
+                    "selected": False,
+                    "name": list(links_to_open.keys()),
+                    "url": list(links_to_open.values()),
+                }
+            )
+            edited = st.data_editor(
+                links_df,
+                column_config={
+                    "selected": st.column_config.CheckboxColumn("Open?"),
+                    "name": st.column_config.TextColumn("Link Name"),
+                    "url": st.column_config.LinkColumn("Link URL"),
+                },
+                disabled=["name", "url"],
+                hide_index=True,
+                num_rows="fixed",
+                key=f"links_{folder_name_to_open}",  # Keep selections per folder
+            )
+            selected_links = edited.loc[edited["selected"]]
 
             if st.button(f"Open Selected Links in '{folder_name_to_open}'"):
-                open_links(dict(selected_links))  # Convert the list back to a dictionary before opening
+                open_links(dict(zip(selected_links["name"], selected_links["url"])))
         else:
             st.info(f"No links found in folder '{folder_name_to_open}'.")
     else: